@@ -26,16 +26,20 @@ from esa_climate_toolbox.constants import CDC_LONG_DATA_STORE_ID
 from esa_climate_toolbox.constants import CDC_SHORT_DATA_STORE_ID
 
 
+_CDC_DATA_STORE_IDS = (
+    CDC_SHORT_DATA_STORE_ID,
+    CDC_LONG_DATA_STORE_ID,
+)
+
+
 def init_plugin(ext_registry: extension.ExtensionRegistry):
-    ext_registry.add_extension(
-        loader=extension.import_component(
-            'xcube_cci.dataaccess:CciOdpDataStore'),
-        point=EXTENSION_POINT_DATA_STORES,
-        name=CDC_SHORT_DATA_STORE_ID,
-        description='ESA Climate Data Centre')
-    ext_registry.add_extension(
-        loader=extension.import_component(
-            'xcube_cci.dataaccess:CciOdpDataStore'),
-        point=EXTENSION_POINT_DATA_STORES,
-        name=CDC_LONG_DATA_STORE_ID,
-        description='ESA Climate Data Centre')
+    # import_component() defers the actual import until the store is first
+    # requested, so a single loader can be shared by all registrations.
+    cdc_data_store_loader = extension.import_component(
+        'xcube_cci.dataaccess:CciOdpDataStore')
+    for data_store_id in _CDC_DATA_STORE_IDS:
+        ext_registry.add_extension(
+            loader=cdc_data_store_loader,
+            point=EXTENSION_POINT_DATA_STORES,
+            name=data_store_id,
+            description='ESA Climate Data Centre')
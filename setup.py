@@ -19,6 +19,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import re
+
 from setuptools import setup, find_packages
 
 requirements = [
@@ -29,9 +31,9 @@ packages = find_packages(exclude=["test", "test.*"])
 
 # Same effect as "from esa_climate_toolbox import version",
 # but avoids importing esa_climate_toolbox:
-version = None
 with open('esa_climate_toolbox/version.py') as f:
-    exec(f.read())
+    version = re.search(r"^version\s*=\s*['\"]([^'\"]+)['\"]",
+                        f.read(), re.MULTILINE).group(1)
 
 setup(
     name="esa_climate_toolbox",